@@ -16,7 +16,7 @@ fi
 
 # TODO: Consider adding as an input parameter
 PYTEST_TARGET=tests
-PYTEST_CMD="${XVFB}pytest -r fEs -s --cov=src --cov-report=xml --cov-append $PYTEST_TARGET"
+PYTEST_CMD="${XVFB}pytest -r fEs -s -n auto --cov=src --cov-report=xml --cov-append $PYTEST_TARGET"
 
 echo $PYTEST_CMD
 sh -c "$PYTEST_CMD"
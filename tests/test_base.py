@@ -1,11 +1,14 @@
-# import random
+from __future__ import annotations
+
+import functools
+import os
+import random
 import re
-from collections.abc import Iterable
-from itertools import product
+from collections.abc import Callable, Iterable
+from itertools import chain, combinations_with_replacement
 from unittest import mock
 
 import pytest
-import re2
 
 import regex_toolkit
 from regex_toolkit.constants import (
@@ -14,10 +17,29 @@ from regex_toolkit.constants import (
     RESERVED_EXPRESSIONS,
 )
 from regex_toolkit.enums import ALL_REGEX_FLAVORS, RegexFlavor
+from regex_toolkit.utils import SORT_BY_LEN_AND_ALPHA_KEY
+
+# Skip rather than error at collection when re2 is not installed
+re2 = pytest.importorskip("re2")
 
 INVALID_REGEX_FLAVORS = [-1, 0, 3, 4]
 
-NON_ASCII_CHARS = [
+# Sorted so tests are collected and swept in the same order regardless of hash seed
+SAFE_CHARS = tuple(sorted(ALWAYS_SAFE))
+ESCAPABLE_CHARS = tuple(sorted(ALWAYS_ESCAPE))
+RESERVED_EXPS = tuple(sorted(RESERVED_EXPRESSIONS))
+SAFE_AND_ESCAPABLE_CHARS = tuple(sorted(ALWAYS_SAFE | ALWAYS_ESCAPE))
+SAFE_TEXT = "".join(SAFE_CHARS)
+ESCAPABLE_TEXT = "".join(ESCAPABLE_CHARS)
+
+# Expected expressions, built once rather than per case (RE and RE2 agree on these)
+ESCAPABLE_EXP = {char: f"\\{char}" for char in ESCAPABLE_CHARS}
+RESERVED_EXP = {exp: f"\\{exp}" for exp in RESERVED_EXPS}
+SAFE_AND_ESCAPABLE_EXP = {
+    char: ESCAPABLE_EXP.get(char, char) for char in SAFE_AND_ESCAPABLE_CHARS
+}
+
+NON_ASCII_CHARS = (
     "🅰",
     "🅱",
     "🅾",
@@ -57,33 +79,111 @@ NON_ASCII_CHARS = [
     "🌃",
     "🌄",
     "🌅",
-]
+)
+NON_ASCII_TEXT = "".join(NON_ASCII_CHARS)
+NON_ASCII_CHARS_RE_EXP = {char: f"\\{char}" for char in NON_ASCII_CHARS}
+
+# Escapes each escapable or non-ASCII char with a backslash (the RE form) in one pass
+BACKSLASH_ESCAPE_TABLE = str.maketrans({**ESCAPABLE_EXP, **NON_ASCII_CHARS_RE_EXP})
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() not in ("", "0", "false", "no")
+
+
+# Set REGEX_TOOLKIT_FULL_MATRIX=1 to sweep every pair rather than a fixed sample
+FULL_MATRIX = _env_flag("REGEX_TOOLKIT_FULL_MATRIX")
+# Set REGEX_TOOLKIT_FULL_TESTS=1 to also compile and match the expressions against
+# each engine (the equality checks against expected expressions always run)
+FULL_TESTS = _env_flag("REGEX_TOOLKIT_FULL_TESTS")
+# For tests that only check engine matches, so they skip rather than pass vacuously
+requires_engine = pytest.mark.skipif(
+    not FULL_TESTS, reason="set REGEX_TOOLKIT_FULL_TESTS=1"
+)
+
+
+def _sample_pairs(
+    elements: Iterable[str], k: int = 200, seed: int = 0
+) -> tuple[tuple[str, str], ...]:
+    # strings_as_exp sorts its input, so mirrored pairs only need testing once
+    pairs = tuple(combinations_with_replacement(sorted(set(elements)), 2))
+    if FULL_MATRIX or len(pairs) <= k:
+        return pairs
+    return tuple(random.Random(seed).sample(pairs, k))
+
+
+# Pairs of texts shared by the strings_as_exp sweeps (computed once for both flavors)
+SAFE_PAIRS = _sample_pairs(SAFE_CHARS)
+ESCAPABLE_PAIRS = _sample_pairs(ESCAPABLE_CHARS)
+RESERVED_PAIRS = _sample_pairs(RESERVED_EXPS)
+SAFE_AND_ESCAPABLE_PAIRS = _sample_pairs(SAFE_AND_ESCAPABLE_CHARS)
+NON_ASCII_PAIRS = _sample_pairs(NON_ASCII_CHARS)
 
 
 # Test helpers
 
 
-def _check_exp_match(exp: str, text: str, flavor: int, *, should_match: bool) -> bool:
-    if flavor == 1:
-        found = bool(re.fullmatch(exp, text))
-        return found if should_match else not found
-    if flavor == 2:
-        found = bool(re2.fullmatch(exp, text))
-        return found if should_match else not found
-    raise ValueError(f"Invalid regex flavor: {flavor!r}")
+def _re2_exp(char: str) -> str:
+    # Codepoints above U+FFFF keep all 8 digits, otherwise trimmed to 4
+    ordinal = ord(char)
+    if ordinal > 0xFFFF:
+        return f"\\x{{{ordinal:08X}}}"
+    return f"\\x{{{ordinal:04X}}}"
 
 
-def assert_exp_match(
-    exp: str, text: str, flavor: int, *, should_match: bool = True
+NON_ASCII_CHARS_RE2_EXP = {char: _re2_exp(char) for char in NON_ASCII_CHARS}
+
+
+# Cached so the same pair is only joined once across both flavors
+@functools.lru_cache(maxsize=None)
+def _expected_alt(texts: tuple[str, ...], to_exp: Callable[[str], str]) -> str:
+    sorted_texts = sorted(set(texts), key=SORT_BY_LEN_AND_ALPHA_KEY)
+    return r"|".join([to_exp(text) for text in sorted_texts])
+
+
+# Compiling and matching is a smoke test that the generated expressions are valid
+# for each engine; correctness is checked by comparing against the expected string
+_COMPILERS = {
+    RegexFlavor.RE: re.compile,
+    RegexFlavor.RE2: re2.compile,
+}
+
+
+def _compile_exp(exp: str, flavor: int) -> re.Pattern | re2._Regexp:
+    return _COMPILERS[flavor](exp)
+
+
+def _check_pattern_match(
+    pattern: re.Pattern | re2._Regexp, text: str, *, should_match: bool
 ) -> bool:
-    assert _check_exp_match(exp, text, flavor, should_match=should_match), (
+    return bool(pattern.fullmatch(text)) == should_match
+
+
+def _check_exp_match(exp: str, text: str, flavor: int, *, should_match: bool) -> bool:
+    return _check_pattern_match(
+        _compile_exp(exp, flavor), text, should_match=should_match
+    )
+
+
+def _exp_match_message(exp: str, text: str, flavor: int, *, should_match: bool) -> str:
+    return (
         f"RE{flavor} Pattern: {exp!r} should match {text!r}"
         if should_match
         else f"RE{flavor} Pattern: {exp!r} should not match {text!r}"
     )
 
 
-def assert_exp_not_match(exp: str, text: str, flavor: int) -> bool:
+def assert_exp_match(
+    exp: str, text: str, flavor: int, *, should_match: bool = True
+) -> None:
+    if not FULL_TESTS:
+        return
+    assert _check_exp_match(
+        exp, text, flavor, should_match=should_match
+    ), _exp_match_message(exp, text, flavor, should_match=should_match)
+
+
+def assert_exp_not_match(exp: str, text: str, flavor: int) -> None:
     assert_exp_match(exp, text, flavor, should_match=False)
 
 
@@ -93,15 +193,52 @@ def assert_exp_match_all(
     flavor: int,
     *,
     should_match: bool = True,
-) -> bool:
+) -> None:
+    if not FULL_TESTS:
+        return
+    # Compile once rather than once per text
+    pattern = _compile_exp(exp, flavor)
     for text in texts:
-        assert_exp_match(exp, text, flavor, should_match=should_match)
+        assert _check_pattern_match(
+            pattern, text, should_match=should_match
+        ), _exp_match_message(exp, text, flavor, should_match=should_match)
 
 
-def assert_exp_not_match_any(exp: str, texts: Iterable[str], flavor: int) -> bool:
+def assert_exp_not_match_any(exp: str, texts: Iterable[str], flavor: int) -> None:
     assert_exp_match_all(exp, texts, flavor, should_match=False)
 
 
+def assert_alternation_match_all(
+    exps: Iterable[str], texts: Iterable[str], flavor: int
+) -> None:
+    if not FULL_TESTS:
+        return
+    # One compile and one scan for every expression (callers compare each to its
+    # expected value); NUL is in none of the texts, so each must match as a whole
+    texts = list(texts)
+    exp_to_test = r"(?:" + r"|".join(exps) + r")"
+    actual = _compile_exp(exp_to_test, flavor).findall("\0".join(texts))
+    assert (
+        actual == texts
+    ), f"RE{flavor} Pattern: {exp_to_test!r} should match each text"
+
+
+def assert_escapes_match_all(
+    chars: Iterable[str],
+    flavor: int,
+    *,
+    to_exp: Callable[[str, int], str] = regex_toolkit.escape,
+) -> None:
+    # Compile one alternation (and one class) of every escape instead of one per char
+    chars = tuple(chars)
+    exps = [to_exp(char, flavor) for char in chars]
+
+    assert_alternation_match_all(exps, chars, flavor)
+
+    exp_to_test = r"^[" + r"".join(exps) + r"]$"
+    assert_exp_match_all(exp_to_test, chars, flavor)
+
+
 # Resolve flavor
 
 
@@ -120,15 +257,13 @@ def test_resolve_flavor(flavor, expected):
     assert regex_toolkit.base.resolve_flavor(flavor) == expected
 
 
-@mock.patch("regex_toolkit.base.default_flavor", RegexFlavor.RE)
-def test_resolve_flavor_None_falls_back_to_default():
-    assert regex_toolkit.base.default_flavor == RegexFlavor.RE
-    regex_toolkit.base.resolve_flavor(None) == regex_toolkit.base.default_flavor
+def test_resolve_flavor_None_falls_back_to_default(monkeypatch):
+    monkeypatch.setattr(regex_toolkit.base, "default_flavor", RegexFlavor.RE)
+    assert regex_toolkit.base.resolve_flavor(None) == RegexFlavor.RE
 
 
-@mock.patch("regex_toolkit.base.default_flavor", None)
-def test_default_flavor_can_be_set():
-    assert regex_toolkit.base.default_flavor is None
+def test_default_flavor_can_be_set(monkeypatch):
+    monkeypatch.setattr(regex_toolkit.base, "default_flavor", None)
     regex_toolkit.base.default_flavor = 2
     assert regex_toolkit.base.resolve_flavor(None) == RegexFlavor.RE2
 
@@ -151,8 +286,8 @@ def test_resolve_flavor_invalid_type_raises():
 
 
 @pytest.mark.parametrize("flavor", INVALID_REGEX_FLAVORS)
-def test_resolve_flavor_None_with_invalid_int_default_raises(flavor):
-    regex_toolkit.base.default_flavor = flavor
+def test_resolve_flavor_None_with_invalid_int_default_raises(flavor, monkeypatch):
+    monkeypatch.setattr(regex_toolkit.base, "default_flavor", flavor)
     with pytest.raises(
         ValueError,
         match=r"^Invalid default regex flavor: .+\. Valid flavors are: \[\-?\d+(, \-?\d+)*\]\.$",
@@ -160,8 +295,8 @@ def test_resolve_flavor_None_with_invalid_int_default_raises(flavor):
         regex_toolkit.base.resolve_flavor(None)
 
 
-@mock.patch("regex_toolkit.base.default_flavor", ["not", "a", "flavor"])
-def test_resolve_flavor_None_with_invalid_type_default_raises():
+def test_resolve_flavor_None_with_invalid_type_default_raises(monkeypatch):
+    monkeypatch.setattr(regex_toolkit.base, "default_flavor", ["not", "a", "flavor"])
     with pytest.raises(
         ValueError,
         match=r"^Invalid default regex flavor: .+\. Valid flavors are: \[\-?\d+(, \-?\d+)*\]\.$",
@@ -169,8 +304,8 @@ def test_resolve_flavor_None_with_invalid_type_default_raises():
         regex_toolkit.base.resolve_flavor(None)
 
 
-@mock.patch("regex_toolkit.base.default_flavor", None)
-def test_resolve_flavor_None_without_default_raises():
+def test_resolve_flavor_None_without_default_raises(monkeypatch):
+    monkeypatch.setattr(regex_toolkit.base, "default_flavor", None)
     with pytest.raises(
         ValueError, match=r"^No regex flavor provided and no default is set\.$"
     ):
@@ -180,51 +315,59 @@ def test_resolve_flavor_None_without_default_raises():
 # RE and RE2 - Escape
 
 
-@pytest.mark.parametrize("char, expected", [(char, char) for char in ALWAYS_SAFE])
+@pytest.mark.parametrize("char, expected", [(char, char) for char in SAFE_CHARS])
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_escape_and_escape2_safe(char, expected, flavor):
     actual = regex_toolkit.escape(char, flavor)
     assert actual == expected
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match(exp_to_test, char, flavor)
 
-    exp_to_test = r"^[" + actual + r"]$"
-    assert_exp_match(exp_to_test, char, flavor)
+@requires_engine
+@pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
+def test_escape_and_escape2_safe_match(flavor):
+    assert_escapes_match_all(SAFE_CHARS, flavor)
 
 
 @pytest.mark.parametrize(
     "char, expected_exp",
-    [(char, f"\\{char}") for char in ALWAYS_ESCAPE],
+    list(ESCAPABLE_EXP.items()),
 )
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_escape_and_escape2_escapable(char, expected_exp, flavor):
     actual = regex_toolkit.escape(char, flavor)
     assert actual == expected_exp
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match(exp_to_test, char, flavor)
 
-    exp_to_test = r"^[" + actual + r"]$"
-    assert_exp_match(exp_to_test, char, flavor)
+@requires_engine
+@pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
+def test_escape_and_escape2_escapable_match(flavor):
+    assert_escapes_match_all(ESCAPABLE_CHARS, flavor)
+
+
+def test_escape_calls_expected_inner_func(monkeypatch):
+    char = "a"
 
+    mock__escape = mock.MagicMock()
+    mock__escape2 = mock.MagicMock()
+    monkeypatch.setattr(regex_toolkit.base, "_escape", mock__escape)
+    monkeypatch.setattr(regex_toolkit.base, "_escape2", mock__escape2)
 
-def test_escape_and_escape2_calls_expected_inner_func():
+    regex_toolkit.escape(char, RegexFlavor.RE)
+    mock__escape.assert_called_once_with(char)
+    mock__escape2.assert_not_called()
+
+
+def test_escape2_calls_expected_inner_func(monkeypatch):
     char = "a"
 
-    flavor = RegexFlavor.RE
-    with mock.patch("regex_toolkit.base._escape") as mock__escape:
-        with mock.patch("regex_toolkit.base._escape2") as mock__escape2:
-            regex_toolkit.escape(char, flavor)
-            mock__escape.assert_called_once_with(char)
-            mock__escape2.assert_not_called()
+    mock__escape = mock.MagicMock()
+    mock__escape2 = mock.MagicMock()
+    monkeypatch.setattr(regex_toolkit.base, "_escape", mock__escape)
+    monkeypatch.setattr(regex_toolkit.base, "_escape2", mock__escape2)
 
-    flavor = RegexFlavor.RE2
-    with mock.patch("regex_toolkit.base._escape") as mock__escape:
-        with mock.patch("regex_toolkit.base._escape2") as mock__escape2:
-            regex_toolkit.escape(char, flavor)
-            mock__escape.assert_not_called()
-            mock__escape2.assert_called_once_with(char)
+    regex_toolkit.escape(char, RegexFlavor.RE2)
+    mock__escape.assert_not_called()
+    mock__escape2.assert_called_once_with(char)
 
 
 # TODO: Add more multi-char tests
@@ -262,47 +405,35 @@ def test_escape_and_escape2_non_str(non_str_char, flavor):
         regex_toolkit.escape(non_str_char, flavor)
 
 
+@requires_engine
+@pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
+def test_escape_and_escape2_unknown_match(flavor):
+    assert_escapes_match_all(NON_ASCII_CHARS, flavor)
+
+
 # RE - Escape
 
 
 @pytest.mark.parametrize(
     "char, expected_exp",
-    [(char, f"\\{char}") for char in NON_ASCII_CHARS],
+    list(NON_ASCII_CHARS_RE_EXP.items()),
 )
 def test_escape_unknown(char, expected_exp):
     actual = regex_toolkit.escape(char, RegexFlavor.RE)
     assert actual == expected_exp
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match(exp_to_test, char, RegexFlavor.RE)
-
-    exp_to_test = r"^[" + actual + r"]$"
-    assert_exp_match(exp_to_test, char, RegexFlavor.RE)
-
 
 # RE2 - Escape
 
 
 @pytest.mark.parametrize(
     "char, expected",
-    [
-        (
-            char,
-            "\\x{" + format(ord(char), "x").zfill(8).removeprefix("0000").upper() + "}",
-        )
-        for char in NON_ASCII_CHARS
-    ],
+    list(NON_ASCII_CHARS_RE2_EXP.items()),
 )
 def test_escape2_unknown(char, expected):
     actual = regex_toolkit.escape(char, RegexFlavor.RE2)
     assert actual == expected
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match(exp_to_test, char, RegexFlavor.RE2)
-
-    exp_to_test = r"^[" + actual + r"]$"
-    assert_exp_match(exp_to_test, char, RegexFlavor.RE2)
-
 
 def test_escape2_trimmed():
     text = "°"
@@ -330,7 +461,7 @@ def test_escape2_untrimmed():
 # RE and RE2 - String as expression
 
 
-@pytest.mark.parametrize("text, expected", [(text, text) for text in ALWAYS_SAFE])
+@pytest.mark.parametrize("text, expected", [(text, text) for text in SAFE_CHARS])
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_string_as_exp_and_exp2_and_exp2_safe_individual_char(text, expected, flavor):
     actual = regex_toolkit.string_as_exp(text, flavor)
@@ -342,8 +473,8 @@ def test_string_as_exp_and_exp2_and_exp2_safe_individual_char(text, expected, fl
 
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_string_as_exp_and_exp2_and_exp2_safe_joined_as_one(flavor):
-    text = "".join(ALWAYS_SAFE)
-    expected = "".join(ALWAYS_SAFE)
+    text = SAFE_TEXT
+    expected = SAFE_TEXT
     actual = regex_toolkit.string_as_exp(text, flavor)
     assert actual == expected
 
@@ -353,7 +484,7 @@ def test_string_as_exp_and_exp2_and_exp2_safe_joined_as_one(flavor):
 
 @pytest.mark.parametrize(
     "text, expected",
-    [(char, f"\\{char}") for char in ALWAYS_ESCAPE],
+    list(ESCAPABLE_EXP.items()),
 )
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_string_as_exp_and_exp2_escapable_individual_char(text, expected, flavor):
@@ -366,8 +497,8 @@ def test_string_as_exp_and_exp2_escapable_individual_char(text, expected, flavor
 
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_string_as_exp_and_exp2_escapable_joined_as_one(flavor):
-    text = "".join(ALWAYS_ESCAPE)
-    expected = "".join(f"\\{char}" for char in ALWAYS_ESCAPE)
+    text = ESCAPABLE_TEXT
+    expected = text.translate(BACKSLASH_ESCAPE_TABLE)
     actual = regex_toolkit.string_as_exp(text, flavor)
     assert actual == expected
 
@@ -375,38 +506,56 @@ def test_string_as_exp_and_exp2_escapable_joined_as_one(flavor):
     assert_exp_match(exp_to_test, text, flavor)
 
 
+@requires_engine
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
 def test_string_as_exp_and_exp2_matches_unicode_chars(flavor):
     high_surrogate_pair_ords = set(range(0xD800, 0xDBFF + 1))
     low_surrogate_pair_ords = set(range(0xDC00, 0xDFFF + 1))
+    string_as_exp = regex_toolkit.string_as_exp
     for i in (
         set(range(0x0000, 0x10FFFF + 1))
         - high_surrogate_pair_ords
         - low_surrogate_pair_ords
     ):
         char = chr(i)
-        actual = regex_toolkit.string_as_exp(char, flavor)
+        actual = string_as_exp(char, flavor)
 
         exp_to_test = r"^" + actual + r"$"
         assert_exp_match(exp_to_test, char, flavor)
 
 
-def test_string_as_exp_and_exp2_calls_expected_inner_func():
+@requires_engine
+@pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
+def test_string_as_exp_and_exp2_unknown_individual_char_match(flavor):
+    assert_escapes_match_all(
+        NON_ASCII_CHARS, flavor, to_exp=regex_toolkit.string_as_exp
+    )
+
+
+def test_string_as_exp_calls_expected_inner_func(monkeypatch):
     text = "foo"
 
-    flavor = RegexFlavor.RE
-    with mock.patch("regex_toolkit.base._string_as_exp") as mock__string_as_exp:
-        with mock.patch("regex_toolkit.base._string_as_exp2") as mock__string_as_exp2:
-            regex_toolkit.string_as_exp(text, flavor)
-            mock__string_as_exp.assert_called_once_with(text)
-            mock__string_as_exp2.assert_not_called()
+    mock__string_as_exp = mock.MagicMock()
+    mock__string_as_exp2 = mock.MagicMock()
+    monkeypatch.setattr(regex_toolkit.base, "_string_as_exp", mock__string_as_exp)
+    monkeypatch.setattr(regex_toolkit.base, "_string_as_exp2", mock__string_as_exp2)
+
+    regex_toolkit.string_as_exp(text, RegexFlavor.RE)
+    mock__string_as_exp.assert_called_once_with(text)
+    mock__string_as_exp2.assert_not_called()
 
-    flavor = RegexFlavor.RE2
-    with mock.patch("regex_toolkit.base._string_as_exp") as mock__string_as_exp:
-        with mock.patch("regex_toolkit.base._string_as_exp2") as mock__string_as_exp2:
-            regex_toolkit.string_as_exp(text, flavor)
-            mock__string_as_exp.assert_not_called()
-            mock__string_as_exp2.assert_called_once_with(text)
+
+def test_string_as_exp2_calls_expected_inner_func(monkeypatch):
+    text = "foo"
+
+    mock__string_as_exp = mock.MagicMock()
+    mock__string_as_exp2 = mock.MagicMock()
+    monkeypatch.setattr(regex_toolkit.base, "_string_as_exp", mock__string_as_exp)
+    monkeypatch.setattr(regex_toolkit.base, "_string_as_exp2", mock__string_as_exp2)
+
+    regex_toolkit.string_as_exp(text, RegexFlavor.RE2)
+    mock__string_as_exp.assert_not_called()
+    mock__string_as_exp2.assert_called_once_with(text)
 
 
 # RE - String as expression
@@ -414,19 +563,16 @@ def test_string_as_exp_and_exp2_calls_expected_inner_func():
 
 @pytest.mark.parametrize(
     "text, expected",
-    [(text, f"\\{text}") for text in NON_ASCII_CHARS],
+    list(NON_ASCII_CHARS_RE_EXP.items()),
 )
 def test_string_as_exp_unsafe_individual_char(text, expected):
     actual = regex_toolkit.string_as_exp(text, RegexFlavor.RE)
     assert actual == expected
 
-    exp_to_test = actual
-    assert_exp_match(exp_to_test, text, RegexFlavor.RE)
-
 
 def test_string_as_exp_unsafe_joined_as_one():
-    text = "".join(NON_ASCII_CHARS)
-    expected = "".join(f"\\{char}" for char in text)
+    text = NON_ASCII_TEXT
+    expected = text.translate(BACKSLASH_ESCAPE_TABLE)
     actual = regex_toolkit.string_as_exp(text, RegexFlavor.RE)
     assert actual == expected
 
@@ -439,28 +585,16 @@ def test_string_as_exp_unsafe_joined_as_one():
 
 @pytest.mark.parametrize(
     "text, expected",
-    [
-        (
-            char,
-            "\\x{" + format(ord(char), "x").zfill(8).removeprefix("0000").upper() + "}",
-        )
-        for char in NON_ASCII_CHARS
-    ],
+    list(NON_ASCII_CHARS_RE2_EXP.items()),
 )
 def test_string_as_exp2_unknown_individual_char(text, expected):
     actual = regex_toolkit.string_as_exp(text, RegexFlavor.RE2)
     assert actual == expected
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match(exp_to_test, text, RegexFlavor.RE2)
-
 
 def test_string_as_exp2_unknown_joined_as_one():
-    text = "".join(NON_ASCII_CHARS)
-    expected = "".join(
-        "\\x{" + format(ord(char), "x").zfill(8).removeprefix("0000").upper() + "}"
-        for char in text
-    )
+    text = NON_ASCII_TEXT
+    expected = "".join(NON_ASCII_CHARS_RE2_EXP.values())
     actual = regex_toolkit.string_as_exp(text, RegexFlavor.RE2)
     assert actual == expected
 
@@ -471,105 +605,70 @@ def test_string_as_exp2_unknown_joined_as_one():
 # RE and RE2 - Strings as expression
 
 
-@pytest.mark.parametrize(
-    "texts, expected",
-    [
-        (
-            texts,
-            r"|".join(
-                sorted(
-                    set(texts),
-                    key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-                )
-            ),
-        )
-        for texts in product(ALWAYS_SAFE, repeat=2)
-    ],
-)
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
-def test_strings_as_exp_and_exp2_safe_of_various_lengths(texts, expected, flavor):
-    actual = regex_toolkit.strings_as_exp(texts, flavor)
-    assert actual == expected
+def test_strings_as_exp_and_exp2_safe_of_various_lengths(flavor):
+    strings_as_exp = regex_toolkit.strings_as_exp
+    failures = []
+    for texts in SAFE_PAIRS:
+        expected = _expected_alt(texts, str)
+        actual = strings_as_exp(texts, flavor)
+        # Safe chars are plain literals, so an exact alternation of them always
+        # matches each text; matching is covered by the safe individual char test
+        if actual != expected:
+            failures.append((texts, actual, expected))
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match_all(exp_to_test, texts, flavor)
+    assert not failures, f"{len(failures)} mismatches: {failures[:10]}"
 
 
-@pytest.mark.parametrize(
-    "texts, expected",
-    [
-        (
-            texts,
-            r"|".join(
-                f"\\{text}"
-                for text in sorted(
-                    set(texts),
-                    key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-                )
-            ),
-        )
-        for texts in product(ALWAYS_ESCAPE, repeat=2)
-    ],
-)
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
-def test_strings_as_exp_and_exp2_escapable_of_various_lengths(texts, expected, flavor):
-    actual = regex_toolkit.strings_as_exp(texts, flavor)
-    assert actual == expected
+def test_strings_as_exp_and_exp2_escapable_of_various_lengths(flavor):
+    strings_as_exp = regex_toolkit.strings_as_exp
+    failures = []
+    for texts in ESCAPABLE_PAIRS:
+        expected = _expected_alt(texts, ESCAPABLE_EXP.__getitem__)
+        actual = strings_as_exp(texts, flavor)
+        # Each escape is matched by the escapable individual char tests, and an
+        # exact alternation of matching escapes always matches each text
+        if actual != expected:
+            failures.append((texts, actual, expected))
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match_all(exp_to_test, texts, flavor)
+    assert not failures, f"{len(failures)} mismatches: {failures[:10]}"
 
 
-@pytest.mark.parametrize(
-    "texts, expected",
-    [
-        (
-            texts,
-            r"|".join(
-                f"\\{text}"
-                for text in sorted(
-                    set(texts),
-                    key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-                )
-            ),
-        )
-        for texts in product(RESERVED_EXPRESSIONS, repeat=2)
-    ],
-)
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
-def test_strings_as_exp_and_exp2_reserved_of_various_lengths(texts, expected, flavor):
-    actual = regex_toolkit.strings_as_exp(texts, flavor)
-    assert actual == expected
+def test_strings_as_exp_and_exp2_reserved_of_various_lengths(flavor):
+    strings_as_exp = regex_toolkit.strings_as_exp
+    failures = []
+    actuals = []
+    for texts in RESERVED_PAIRS:
+        expected = _expected_alt(texts, RESERVED_EXP.__getitem__)
+        actual = strings_as_exp(texts, flavor)
+        if actual != expected:
+            failures.append((texts, actual, expected))
+        actuals.append(actual)
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match_all(exp_to_test, texts, flavor)
+    assert not failures, f"{len(failures)} mismatches: {failures[:10]}"
 
+    assert_alternation_match_all(actuals, chain.from_iterable(RESERVED_PAIRS), flavor)
 
-@pytest.mark.parametrize(
-    "texts, expected",
-    [
-        (
-            texts,
-            r"|".join(
-                text if text in ALWAYS_SAFE else f"\\{text}"
-                for text in sorted(
-                    set(texts),
-                    key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-                )
-            ),
-        )
-        for texts in product(ALWAYS_SAFE | ALWAYS_ESCAPE, repeat=2)
-    ],
-)
-@pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
-def test_strings_as_exp_and_exp2_safe_and_escapable_of_various_lengths(
-    texts, expected, flavor
-):
-    actual = regex_toolkit.strings_as_exp(texts, flavor)
-    assert actual == expected
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match_all(exp_to_test, texts, flavor)
+@pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
+def test_strings_as_exp_and_exp2_safe_and_escapable_of_various_lengths(flavor):
+    strings_as_exp = regex_toolkit.strings_as_exp
+    failures = []
+    actuals = []
+    for texts in SAFE_AND_ESCAPABLE_PAIRS:
+        expected = _expected_alt(texts, SAFE_AND_ESCAPABLE_EXP.__getitem__)
+        actual = strings_as_exp(texts, flavor)
+        if actual != expected:
+            failures.append((texts, actual, expected))
+        actuals.append(actual)
+
+    assert not failures, f"{len(failures)} mismatches: {failures[:10]}"
+
+    assert_alternation_match_all(
+        actuals, chain.from_iterable(SAFE_AND_ESCAPABLE_PAIRS), flavor
+    )
 
 
 @pytest.mark.parametrize("flavor", ALL_REGEX_FLAVORS)
@@ -593,78 +692,72 @@ def test_strings_as_exp_and_exp2_empty_of_various_sequence_types(seq, flavor):
     assert regex_toolkit.strings_as_exp(seq, flavor) == ""
 
 
-def test_strings_as_exp_calls_expected_inner_func():
+def test_strings_as_exp_calls_expected_inner_func(monkeypatch):
+    texts = ["foo", "bar"]
+
+    mock__strings_as_exp = mock.MagicMock()
+    mock__strings_as_exp2 = mock.MagicMock()
+    monkeypatch.setattr(regex_toolkit.base, "_strings_as_exp", mock__strings_as_exp)
+    monkeypatch.setattr(regex_toolkit.base, "_strings_as_exp2", mock__strings_as_exp2)
+
+    regex_toolkit.base.strings_as_exp(texts, RegexFlavor.RE)
+    mock__strings_as_exp.assert_called_once_with(set(texts))
+    mock__strings_as_exp2.assert_not_called()
+
+
+def test_strings_as_exp2_calls_expected_inner_func(monkeypatch):
     texts = ["foo", "bar"]
 
-    flavor = RegexFlavor.RE
-    with mock.patch("regex_toolkit.base._strings_as_exp") as mock__strings_as_exp:
-        with mock.patch("regex_toolkit.base._strings_as_exp2") as mock__strings_as_exp2:
-            regex_toolkit.base.strings_as_exp(texts, flavor)
-            mock__strings_as_exp.assert_called_once_with(set(texts))
-            mock__strings_as_exp2.assert_not_called()
+    mock__strings_as_exp = mock.MagicMock()
+    mock__strings_as_exp2 = mock.MagicMock()
+    monkeypatch.setattr(regex_toolkit.base, "_strings_as_exp", mock__strings_as_exp)
+    monkeypatch.setattr(regex_toolkit.base, "_strings_as_exp2", mock__strings_as_exp2)
 
-    flavor = RegexFlavor.RE2
-    with mock.patch("regex_toolkit.base._strings_as_exp") as mock__strings_as_exp:
-        with mock.patch("regex_toolkit.base._strings_as_exp2") as mock__strings_as_exp2:
-            regex_toolkit.base.strings_as_exp(texts, flavor)
-            mock__strings_as_exp.assert_not_called()
-            mock__strings_as_exp2.assert_called_once_with(set(texts))
+    regex_toolkit.base.strings_as_exp(texts, RegexFlavor.RE2)
+    mock__strings_as_exp.assert_not_called()
+    mock__strings_as_exp2.assert_called_once_with(set(texts))
 
 
 # RE - Strings as expression
 
 
-@pytest.mark.parametrize(
-    "texts, expected",
-    [
-        (
-            texts,
-            r"|".join(
-                f"\\{text}"
-                for text in sorted(
-                    set(texts),
-                    key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-                )
-            ),
-        )
-        for texts in product(NON_ASCII_CHARS, repeat=2)
-    ],
-)
-def test_strings_as_exp_unsafe_of_various_lengths(texts, expected):
-    actual = regex_toolkit.strings_as_exp(texts, RegexFlavor.RE)
-    assert actual == expected
+def test_strings_as_exp_unsafe_of_various_lengths():
+    strings_as_exp = regex_toolkit.strings_as_exp
+    failures = []
+    actuals = []
+    for texts in NON_ASCII_PAIRS:
+        expected = _expected_alt(texts, NON_ASCII_CHARS_RE_EXP.__getitem__)
+        actual = strings_as_exp(texts, RegexFlavor.RE)
+        if actual != expected:
+            failures.append((texts, actual, expected))
+        actuals.append(actual)
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match_all(exp_to_test, texts, RegexFlavor.RE)
+    assert not failures, f"{len(failures)} mismatches: {failures[:10]}"
+
+    assert_alternation_match_all(
+        actuals, chain.from_iterable(NON_ASCII_PAIRS), RegexFlavor.RE
+    )
 
 
 # RE2 - Strings as expression
 
 
-@pytest.mark.parametrize(
-    "texts, expected",
-    [
-        (
-            texts,
-            r"|".join(
-                "\\x{"
-                + format(ord(char), "x").zfill(8).removeprefix("0000").upper()
-                + "}"
-                for char in sorted(
-                    set(texts),
-                    key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-                )
-            ),
-        )
-        for texts in product(NON_ASCII_CHARS, repeat=2)
-    ],
-)
-def test_strings_as_exp2_unsafe_of_various_lengths(texts, expected):
-    actual = regex_toolkit.strings_as_exp(texts, RegexFlavor.RE2)
-    assert actual == expected
+def test_strings_as_exp2_unsafe_of_various_lengths():
+    strings_as_exp = regex_toolkit.strings_as_exp
+    failures = []
+    actuals = []
+    for texts in NON_ASCII_PAIRS:
+        expected = _expected_alt(texts, NON_ASCII_CHARS_RE2_EXP.__getitem__)
+        actual = strings_as_exp(texts, RegexFlavor.RE2)
+        if actual != expected:
+            failures.append((texts, actual, expected))
+        actuals.append(actual)
 
-    exp_to_test = r"^" + actual + r"$"
-    assert_exp_match_all(exp_to_test, texts, RegexFlavor.RE2)
+    assert not failures, f"{len(failures)} mismatches: {failures[:10]}"
+
+    assert_alternation_match_all(
+        actuals, chain.from_iterable(NON_ASCII_PAIRS), RegexFlavor.RE2
+    )
 
 
 # RE - Make expression
@@ -674,23 +767,23 @@ def test_strings_as_exp2_unsafe_of_various_lengths(texts, expected):
     "chars, expected",
     (
         # 1 char does not make a range
-        (["a"], "a"),
+        (("a",), "a"),
         # 2 sequential chars should not make a range
-        (["a", "b"], "ab"),
+        (("a", "b"), "ab"),
         # 3+ sequential chars make a range
-        (["a", "b", "c"], "a-c"),
+        (("a", "b", "c"), "a-c"),
         # 3+ non-sequential chars should not make a range
-        (["a", "c", "e"], "ace"),
+        (("a", "c", "e"), "ace"),
         # 3+ sequential chars with extra out of range char
-        (["a", "b", "c", "z"], "a-cz"),
+        (("a", "b", "c", "z"), "a-cz"),
         # Chars should always be ordered by ordinal
-        (["b", "a"], "ab"),
+        (("b", "a"), "ab"),
         # Chars should always be ordered by ordinal
-        (["e", "c", "a"], "ace"),
+        (("e", "c", "a"), "ace"),
         # Chars should always be ordered by ordinal
-        (["z", "c", "b", "a"], "a-cz"),
+        (("z", "c", "b", "a"), "a-cz"),
         # Duplicates should have no effect
-        (["d", "a", "b", "c", "a"], "a-d"),
+        (("d", "a", "b", "c", "a"), "a-d"),
     ),
 )
 def test_make_exp(chars, expected):
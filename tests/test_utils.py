@@ -1,5 +1,6 @@
-import unittest
+import platform
 from collections.abc import Generator, Iterable
+from itertools import pairwise
 
 import pytest
 
@@ -10,22 +11,11 @@ def is_sorted_by_length_and_alphabetically(
     texts: Iterable[str],
     reverse: bool = False,
 ) -> bool:
-    prev_len, prev_text = None, None
-    for text in texts:
-        if prev_len is None:
-            prev_len, prev_text = len(text), text
-        if reverse:
-            if len(text) < prev_len:
-                return False
-            elif (len(text) == prev_len) and (text > prev_text):
-                return False
-        else:
-            if len(text) > prev_len:
-                return False
-            elif (len(text) == prev_len) and (text < prev_text):
-                return False
-        prev_len, prev_text = len(text), text
-    return True
+    # Longest first, then alphabetically (the other way around when reversed)
+    keys = [(-len(text), text) for text in texts]
+    if reverse:
+        return all(prev >= key for prev, key in pairwise(keys))
+    return all(prev <= key for prev, key in pairwise(keys))
 
 
 SORT_BY_LEN_TEXTS = [
@@ -48,25 +38,36 @@ SORT_BY_LEN_TEXTS_BY_TYPE = {
     list: list(SORT_BY_LEN_TEXTS),
     dict: dict.fromkeys(SORT_BY_LEN_TEXTS, None),
 }
-
-
-@pytest.mark.parametrize("try_type, typed_texts", SORT_BY_LEN_TEXTS_BY_TYPE.items())
-@pytest.mark.parametrize("reverse", (False, True))
-def test_iter_sort_by_len_and_alpha(try_type, typed_texts, reverse):
-    expected_tuple = tuple(
+# The texts are unique, so the order is the same for every container type
+SORT_BY_LEN_EXPECTED = {
+    reverse: tuple(
         sorted(
-            typed_texts,
+            SORT_BY_LEN_TEXTS,
             key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
             reverse=reverse,
         )
     )
-    assert is_sorted_by_length_and_alphabetically(expected_tuple, reverse=reverse)
+    for reverse in (False, True)
+}
+
+
+@pytest.mark.parametrize("reverse", (False, True))
+def test_sort_by_len_expected_is_sorted(reverse):
+    assert is_sorted_by_length_and_alphabetically(
+        SORT_BY_LEN_EXPECTED[reverse], reverse=reverse
+    )
 
+
+@pytest.mark.parametrize("try_type, typed_texts", SORT_BY_LEN_TEXTS_BY_TYPE.items())
+@pytest.mark.parametrize("reverse", (False, True))
+def test_iter_sort_by_len_and_alpha(try_type, typed_texts, reverse):
+    expected_tuple = SORT_BY_LEN_EXPECTED[reverse]
     actual = regex_toolkit.utils.iter_sort_by_len_and_alpha(
         typed_texts, reverse=reverse
     )
+    assert isinstance(actual, Generator)
     actual_tuple = tuple(actual)
-    assert isinstance(actual, Generator) and (actual_tuple == expected_tuple), {
+    assert actual_tuple == expected_tuple, {
         "try_type": try_type,
         "typed_texts": typed_texts,
         "reverse": reverse,
@@ -78,15 +79,7 @@ def test_iter_sort_by_len_and_alpha(try_type, typed_texts, reverse):
 @pytest.mark.parametrize("try_type, typed_texts", SORT_BY_LEN_TEXTS_BY_TYPE.items())
 @pytest.mark.parametrize("reverse", (False, True))
 def test_sort_by_len_and_alpha(try_type, typed_texts, reverse):
-    expected = tuple(
-        sorted(
-            typed_texts,
-            key=regex_toolkit.utils.SORT_BY_LEN_AND_ALPHA_KEY,
-            reverse=reverse,
-        )
-    )
-    assert is_sorted_by_length_and_alphabetically(expected, reverse=reverse)
-
+    expected = SORT_BY_LEN_EXPECTED[reverse]
     actual = regex_toolkit.utils.sort_by_len_and_alpha(typed_texts, reverse=reverse)
     assert isinstance(actual, tuple) and (actual == expected), {
         "try_type": try_type,
@@ -210,22 +203,19 @@ ITER_CHAR_RANGE_CASES = [
 
 
 @pytest.mark.parametrize("char_range, expected", ITER_CHAR_RANGE_CASES)
-def test_char_range(char_range, expected):
-    actual = regex_toolkit.char_range(*char_range)
-    assert isinstance(actual, tuple)
-    assert actual == expected, {
-        "char_range": char_range,
-        "actual": actual,
-        "expected": expected,
-    }
-
-
-@pytest.mark.parametrize("char_range, expected", ITER_CHAR_RANGE_CASES)
-def test_iter_char_range(char_range, expected):
-    actual = regex_toolkit.iter_char_range(*char_range)
-    assert isinstance(actual, Generator)
+@pytest.mark.parametrize(
+    "func, expected_type",
+    (
+        (regex_toolkit.char_range, tuple),
+        (regex_toolkit.iter_char_range, Generator),
+    ),
+)
+def test_char_range_and_iter_char_range(char_range, expected, func, expected_type):
+    actual = func(*char_range)
+    assert isinstance(actual, expected_type)
     actual_tuple = tuple(actual)
     assert actual_tuple == expected, {
+        "func": func.__name__,
         "char_range": char_range,
         "actual_tuple": actual_tuple,
         "expected": expected,
@@ -233,14 +223,41 @@ def test_iter_char_range(char_range, expected):
 
 
 @pytest.mark.parametrize(
-    "text, expected",
+    "text",
     (
         # Empty string
-        ("", ""),
+        "",
         # Already NFC
-        ("a", "a"),
+        "a",
         # Already NFC (non-ASCII)
-        ("🐶🐾", "🐶🐾"),
+        "🐶🐾",
+    ),
+)
+def test_to_nfc_already_nfc(text):
+    actual = regex_toolkit.to_nfc(text)
+    assert actual == text, {
+        "text": text,
+        "actual": actual,
+    }
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="returning the same object is a CPython implementation detail",
+)
+def test_to_nfc_already_nfc_is_unchanged_object():
+    # Pick a non-ASCII string so the identity isn't down to interned small strings
+    text = "🐶🐾"
+    actual = regex_toolkit.to_nfc(text)
+    assert actual is text, {
+        "text": text,
+        "actual": actual,
+    }
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    (
         # Basic combining char (acute accent)
         ("a\u0301", "á"),
         # Multiple combining chars (diaeresis and acute accent)
@@ -257,24 +274,25 @@ def test_to_nfc(text, expected):
     }
 
 
-class TestMasking(unittest.TestCase):
-    def setUp(self):
-        self.text = "This is an example"
-
-    def test_insert_word(self):
-        indexes = (8, 8)
-        for try_type, typed_indexes in ((tuple, indexes), (list, list(indexes))):
-            with self.subTest(try_type=try_type, indexes=indexes):
-                self.assertEqual(
-                    regex_toolkit.mask_span(self.text, typed_indexes, "not "),
-                    "This is not an example",
-                )
-
-    def test_replace_word(self):
-        indexes = (5, 7)
-        for try_type, typed_indexes in ((tuple, indexes), (list, list(indexes))):
-            with self.subTest(try_type=try_type, indexes=indexes):
-                self.assertEqual(
-                    regex_toolkit.mask_span(self.text, typed_indexes, "isn't"),
-                    "This isn't an example",
-                )
+MASK_SPAN_TEXT = "This is an example"
+
+
+@pytest.mark.parametrize(
+    "span, mask, expected",
+    (
+        # Insert a word (empty span)
+        ((8, 8), "not ", "This is not an example"),
+        # Replace a word
+        ((5, 7), "isn't", "This isn't an example"),
+    ),
+)
+@pytest.mark.parametrize("span_type", (tuple, list))
+def test_mask_span(span, mask, expected, span_type):
+    typed_span = span_type(span)
+    actual = regex_toolkit.mask_span(MASK_SPAN_TEXT, typed_span, mask)
+    assert actual == expected, {
+        "span": typed_span,
+        "mask": mask,
+        "actual": actual,
+        "expected": expected,
+    }